@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, Callable, List, Tuple
 
-from .obj_writer import write_obj
+from . import obj_writer, primitives
+from .obj_writer import ObjMesh, write_obj
 from .primitives import plane_grid, saddle_grid, sphere_uv, torus
 
 
@@ -27,86 +33,140 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--plane-size", type=float, default=1.4)
     parser.add_argument("--plane-divisions", type=int, default=64)
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Worker processes (1 = run sequentially; default: min(4, CPU count))",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Always regenerate instead of reusing cached OBJ files")
+
     return parser.parse_args()
 
 
-def main() -> None:
-    args = parse_args()
-    out_dir: Path = args.out
-    out_dir.mkdir(parents=True, exist_ok=True)
+MeshTask = Tuple[Callable[..., ObjMesh], Tuple[Any, ...], Path, List[str]]
 
-    sphere = sphere_uv(args.sphere_radius, args.sphere_slices, args.sphere_stacks)
-    write_obj(
-        str(out_dir / "sphere.obj"),
-        sphere.vertices,
-        sphere.faces,
-        header=[
-            "Generated sphere (UV)",
-            f"slices={args.sphere_slices}",
-            f"stacks={args.sphere_stacks}",
-            f"radius={args.sphere_radius}",
-        ],
-    )
 
-    # A deliberately low-res sphere to highlight differences between:
-    # - Dijkstra on mesh edges (polyhedral approximation)
-    # - Analytic great-circle on an ideal sphere
-    sphere_low = sphere_uv(args.sphere_radius, 12, 6)
-    write_obj(
-        str(out_dir / "sphere_low.obj"),
-        sphere_low.vertices,
-        sphere_low.faces,
-        header=[
-            "Generated sphere (UV) - low resolution",
-            "slices=12",
-            "stacks=6",
-            f"radius={args.sphere_radius}",
-        ],
-    )
+def build_tasks(args: argparse.Namespace) -> List[MeshTask]:
+    out_dir: Path = args.out
+    return [
+        (
+            sphere_uv,
+            (args.sphere_radius, args.sphere_slices, args.sphere_stacks),
+            out_dir / "sphere.obj",
+            [
+                "Generated sphere (UV)",
+                f"slices={args.sphere_slices}",
+                f"stacks={args.sphere_stacks}",
+                f"radius={args.sphere_radius}",
+            ],
+        ),
+        # A deliberately low-res sphere to highlight differences between:
+        # - Dijkstra on mesh edges (polyhedral approximation)
+        # - Analytic great-circle on an ideal sphere
+        (
+            sphere_uv,
+            (args.sphere_radius, 12, 6),
+            out_dir / "sphere_low.obj",
+            [
+                "Generated sphere (UV) - low resolution",
+                "slices=12",
+                "stacks=6",
+                f"radius={args.sphere_radius}",
+            ],
+        ),
+        (
+            plane_grid,
+            (args.plane_size, args.plane_divisions),
+            out_dir / "plane.obj",
+            [
+                "Generated plane grid (Z=0)",
+                f"size={args.plane_size}",
+                f"divisions={args.plane_divisions}",
+            ],
+        ),
+        (
+            torus,
+            (args.torus_major, args.torus_minor, args.torus_seg_major, args.torus_seg_minor),
+            out_dir / "donut.obj",
+            [
+                "Generated torus",
+                f"major_radius={args.torus_major}",
+                f"minor_radius={args.torus_minor}",
+                f"segments_major={args.torus_seg_major}",
+                f"segments_minor={args.torus_seg_minor}",
+            ],
+        ),
+        (
+            saddle_grid,
+            (args.saddle_size, args.saddle_divisions, args.saddle_height),
+            out_dir / "saddle.obj",
+            [
+                "Generated saddle z = h*(x^2 - y^2)",
+                f"size={args.saddle_size}",
+                f"divisions={args.saddle_divisions}",
+                f"height={args.saddle_height}",
+            ],
+        ),
+    ]
+
+
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+
+
+def _cache_key(task: MeshTask) -> str:
+    """Hash the task and the generator sources, so edits invalidate old entries."""
+    func, func_args, _, header = task
+    sources = [Path(__file__), Path(primitives.__file__), Path(obj_writer.__file__)]
+    mtimes = tuple(os.path.getmtime(src) for src in sources)
+    payload = repr((func.__name__, func_args, header, mtimes)).encode("utf-8")
+    return hashlib.blake2b(payload).hexdigest()[:16]
+
+
+def run_task(task: MeshTask, cache_dir: Path | None = None) -> Path:
+    """Generate one mesh and write it; runs inside a worker process.
+
+    With ``cache_dir`` set, each output file keeps one cache entry named
+    ``<stem>-<key>.obj``. A hit copies that entry to the output path; a miss
+    writes the output path directly, copies it into the cache and drops the
+    stale entries for the same output name.
+    """
+    func, func_args, out_path, header = task
+    if cache_dir is not None:
+        cached = cache_dir / f"{out_path.stem}-{_cache_key(task)}.obj"
+        if cached.exists():
+            shutil.copyfile(cached, out_path)
+            return out_path
+
+    mesh = func(*func_args)
+    write_obj(str(out_path), mesh.vertices, mesh.faces, header=header)
+
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale in cache_dir.glob(f"{out_path.stem}-*.obj"):
+            stale.unlink(missing_ok=True)
+        tmp = cached.with_suffix(f".{os.getpid()}.tmp")
+        shutil.copyfile(out_path, tmp)
+        os.replace(tmp, cached)
+    return out_path
 
-    plane = plane_grid(args.plane_size, args.plane_divisions)
-    write_obj(
-        str(out_dir / "plane.obj"),
-        plane.vertices,
-        plane.faces,
-        header=[
-            "Generated plane grid (Z=0)",
-            f"size={args.plane_size}",
-            f"divisions={args.plane_divisions}",
-        ],
-    )
 
-    torus_mesh = torus(
-        args.torus_major,
-        args.torus_minor,
-        args.torus_seg_major,
-        args.torus_seg_minor,
-    )
-    write_obj(
-        str(out_dir / "donut.obj"),
-        torus_mesh.vertices,
-        torus_mesh.faces,
-        header=[
-            "Generated torus",
-            f"major_radius={args.torus_major}",
-            f"minor_radius={args.torus_minor}",
-            f"segments_major={args.torus_seg_major}",
-            f"segments_minor={args.torus_seg_minor}",
-        ],
-    )
+def main() -> None:
+    args = parse_args()
+    out_dir: Path = args.out
+    out_dir.mkdir(parents=True, exist_ok=True)
 
-    saddle = saddle_grid(args.saddle_size, args.saddle_divisions, args.saddle_height)
-    write_obj(
-        str(out_dir / "saddle.obj"),
-        saddle.vertices,
-        saddle.faces,
-        header=[
-            "Generated saddle z = h*(x^2 - y^2)",
-            f"size={args.saddle_size}",
-            f"divisions={args.saddle_divisions}",
-            f"height={args.saddle_height}",
-        ],
-    )
+    tasks = build_tasks(args)
+    cache_dir = None if args.no_cache else CACHE_DIR
+    if args.jobs <= 1:
+        for task in tasks:
+            run_task(task, cache_dir)
+        return
+
+    # Primitives are independent; processes sidestep the GIL for the
+    # Python-level formatting in write_obj.
+    with ProcessPoolExecutor(max_workers=min(args.jobs, len(tasks))) as pool:
+        list(pool.map(run_task, tasks, [cache_dir] * len(tasks)))
 
 
 if __name__ == "__main__":
@@ -1,72 +1,102 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Tuple
+from typing import Iterable, Sequence, Tuple
 
+import numpy as np
 
+
+# Row types accepted at the API boundary; meshes themselves store ndarrays.
 Vector3 = Tuple[float, float, float]
-Face = Tuple[int, int, int]  # 1-based indices
+Face = Tuple[int, int, int]  # 0-based indices
 
 
 @dataclass
 class ObjMesh:
-    vertices: List[Vector3]
-    faces: List[Face]
+    vertices: np.ndarray  # (N, 3) float32
+    faces: np.ndarray  # (M, 3) int32, 0-based indices
+
+
+def _as_vertex_array(vertices: Sequence[Vector3] | np.ndarray) -> np.ndarray:
+    return np.asarray(vertices, dtype=np.float32).reshape(-1, 3)
+
+
+def _as_face_array(faces: Sequence[Face] | np.ndarray) -> np.ndarray:
+    return np.asarray(faces, dtype=np.int32).reshape(-1, 3)
 
 
-def compact_mesh(vertices: Sequence[Vector3], faces: Sequence[Face]) -> ObjMesh:
+def compact_mesh(vertices: Sequence[Vector3] | np.ndarray, faces: Sequence[Face] | np.ndarray) -> ObjMesh:
     """Remove unreferenced vertices and reindex faces.
 
-    Faces are expected to use 1-based indexing (OBJ convention).
+    Faces use 0-based indexing; the OBJ 1-based offset is applied by
+    write_obj.
     """
-    if not vertices:
-        return ObjMesh([], list(faces))
+    vertices = _as_vertex_array(vertices)
+    faces = _as_face_array(faces)
+    if len(vertices) == 0:
+        return ObjMesh(vertices, faces)
 
-    used: set[int] = set()
-    vcount = len(vertices)
-    for a, b, c in faces:
-        for idx in (a, b, c):
-            if idx < 1 or idx > vcount:
-                raise ValueError(
-                    f"Face index {idx} out of range for {vcount} vertices",
-                )
-            used.add(idx)
-
-    if not used:
+    if faces.size == 0:
         # No faces => keep vertices as-is.
-        return ObjMesh(list(vertices), list(faces))
+        return ObjMesh(vertices, faces)
+
+    vcount = len(vertices)
+    lo, hi = int(faces.min()), int(faces.max())
+    if lo < 0 or hi >= vcount:
+        idx = lo if lo < 0 else hi
+        raise ValueError(
+            f"Face index {idx} out of range for {vcount} vertices",
+        )
 
-    used_sorted = sorted(used)
-    remap: dict[int, int] = {old: new for new, old in enumerate(used_sorted, start=1)}
-    new_vertices = [vertices[i - 1] for i in used_sorted]
-    new_faces: List[Face] = [
-        (remap[a], remap[b], remap[c])
-        for (a, b, c) in faces
-    ]
+    used, inverse = np.unique(faces, return_inverse=True)
+    new_vertices = vertices[used]
+    new_faces = inverse.reshape(-1, 3).astype(np.int32)
 
     return ObjMesh(new_vertices, new_faces)
 
 
+def _write_all(fd: int, payload: bytes) -> None:
+    """Write ``payload`` to ``fd`` with ``os.write``, resuming after short writes.
+
+    write_obj calls this once per formatted block, so memory use is bounded
+    by the block size (``_BLOCK_ROWS`` rows), not by the mesh size.
+    """
+    view = memoryview(payload)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+_BLOCK_ROWS = 1 << 16
+
+
+def _format_block(row_fmt: str, block: np.ndarray) -> bytes:
+    """Format every row of ``block`` with a single %-operation."""
+    return ((row_fmt * len(block)) % tuple(block.ravel().tolist())).encode("ascii")
+
+
 def write_obj(
     path: str,
-    vertices: Sequence[Vector3],
-    faces: Sequence[Face],
+    vertices: Sequence[Vector3] | np.ndarray,
+    faces: Sequence[Face] | np.ndarray,
     header: Iterable[str] | None = None,
     *,
     compact: bool = True,
 ) -> None:
     if compact:
         mesh = compact_mesh(vertices, faces)
-        vertices = mesh.vertices
-        faces = mesh.faces
-    with open(path, "w", encoding="utf-8") as f:
+    else:
+        mesh = ObjMesh(_as_vertex_array(vertices), _as_face_array(faces))
+    with open(path, "wb", buffering=0) as f:
+        fd = f.fileno()
         if header:
-            for line in header:
-                f.write(f"# {line}\n")
-        for v in vertices:
-            f.write(f"v {v[0]:.6f} {v[1]:.6f} {v[2]:.6f}\n")
-        for a, b, c in faces:
-            f.write(f"f {a} {b} {c}\n")
-
+            _write_all(fd, "".join(f"# {line}\n" for line in header).encode("utf-8"))
+        for start in range(0, len(mesh.vertices), _BLOCK_ROWS):
+            block = mesh.vertices[start : start + _BLOCK_ROWS]
+            _write_all(fd, _format_block("v %.6f %.6f %.6f\n", block))
+        for start in range(0, len(mesh.faces), _BLOCK_ROWS):
+            block = mesh.faces[start : start + _BLOCK_ROWS] + 1
+            _write_all(fd, _format_block("f %d %d %d\n", block))
 
 __all__ = ["ObjMesh", "write_obj", "compact_mesh", "Vector3", "Face"]
@@ -1,19 +1,68 @@
 from __future__ import annotations
 
-import math
-from typing import List, Tuple
+import numpy as np
+
+from .obj_writer import ObjMesh
+
+
+def _quad_faces(
+    rows: int,
+    cols: int,
+    stride: int,
+    offset: int,
+    *,
+    wrap: bool = False,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Triangulate a rows x cols block of quads laid out row-major.
+
+    Vertex (i, j) has 0-based index ``offset + i*stride + j``. Each quad a-b-c-d
+    (a=(i, j), b=(i+1, j), c=(i+1, j+1), d=(i, j+1)) is split into (a, b, d)
+    and (b, c, d), emitted in that order. With ``wrap`` the column after the
+    last one is column 0 (closed rings without a seam vertex). Triangles are
+    written into ``out`` (shape (2*rows*cols, 3)) when given.
+    """
+    if out is None:
+        out = np.empty((2 * rows * cols, 3), dtype=np.int32)
+    i = np.arange(rows, dtype=np.int32)[:, None]
+    j = np.arange(cols, dtype=np.int32)[None, :]
+    j_next = (j + 1) % cols if wrap else j + 1
+    a = offset + i * stride + j
+    b = a + stride
+    d = offset + i * stride + j_next
+    c = d + stride
+    tris = out.reshape(rows, cols, 2, 3)
+    tris[..., 0, 0] = a
+    tris[..., 0, 1] = b
+    tris[..., 0, 2] = d
+    tris[..., 1, 0] = b
+    tris[..., 1, 1] = c
+    tris[..., 1, 2] = d
+    return out
+
+
+def _grid_vertices(rows: int, cols: int) -> tuple[np.ndarray, np.ndarray]:
+    """Allocate a flat (rows*cols, 3) vertex array and its (rows, cols, 3) view.
+
+    Vertices are stored as float32 to halve memory traffic. Angle/coordinate
+    tables stay float64 and are narrowed on assignment. float32 carries about
+    7 significant digits, so printed coordinates can differ from a float64
+    build in the sixth decimal, and by more once magnitudes exceed ~8.
+    """
+    vertices = np.empty((rows * cols, 3), dtype=np.float32)
+    return vertices, vertices.reshape(rows, cols, 3)
+
 
-from .obj_writer import Face, ObjMesh, Vector3
+def _mirror_z(dst: np.ndarray, src: np.ndarray) -> None:
+    """Write ``src`` reflected through the xy-plane (z negated) into ``dst``."""
+    dst[..., :2] = src[..., :2]
+    np.negative(src[..., 2], out=dst[..., 2])
 
 
 def sphere_uv(radius: float, slices: int, stacks: int) -> ObjMesh:
     """Generate a UV sphere without seam/pole duplicate vertices.
 
-    The previous implementation created (slices+1) duplicates at each ring and
-    then selectively omitted triangles at the poles, which can leave at least
-    one vertex never referenced by any face (e.g., OBJ vertex 1).
-
-    This version creates:
+    Creates:
     - 1 top pole vertex
     - (stacks-1) latitude rings, each with exactly `slices` vertices
     - 1 bottom pole vertex
@@ -25,157 +74,114 @@ def sphere_uv(radius: float, slices: int, stacks: int) -> ObjMesh:
     if stacks < 2:
         raise ValueError("stacks must be >= 2")
 
-    vertices: List[Vector3] = []
-    faces: List[Face] = []
-
-    # Top pole
-    vertices.append((0.0, 0.0, radius))
-
-    # Rings (exclude poles)
-    for i in range(1, stacks):
-        v = i / stacks
-        phi = v * math.pi  # (0, pi)
-        sin_phi = math.sin(phi)
-        cos_phi = math.cos(phi)
-        for j in range(slices):
-            u = j / slices
-            theta = u * 2.0 * math.pi
-            sin_theta = math.sin(theta)
-            cos_theta = math.cos(theta)
-            x = radius * sin_phi * cos_theta
-            y = radius * sin_phi * sin_theta
-            z = radius * cos_phi
-            vertices.append((x, y, z))
-
-    # Bottom pole
-    vertices.append((0.0, 0.0, -radius))
-
-    top = 1  # OBJ 1-based
-    bottom = len(vertices)
-
-    def ring_index(ring: int, j: int) -> int:
+    ring_count = stacks - 1
+    vertices = np.empty((2 + ring_count * slices, 3), dtype=np.float32)
+    faces = np.empty((2 * slices + 2 * slices * (ring_count - 1), 3), dtype=np.int32)
+
+    vertices[0] = (0.0, 0.0, radius)
+    vertices[-1] = (0.0, 0.0, -radius)
+
+    # Rings (exclude poles), one row per latitude with `slices` columns.
+    # Only the northern rings (plus the equator when stacks is even) are
+    # evaluated; the southern ones are their mirror images in z.
+    north_count = (ring_count + 1) // 2
+    phi = np.linspace(0.0, np.pi, stacks + 1)[1 : 1 + north_count]  # (0, pi/2]
+    theta = (np.arange(slices) / slices) * 2.0 * np.pi
+    # Trig tables: one entry per ring / per slice, shared across the grid.
+    ring_radius = radius * np.sin(phi)
+    cos_theta = np.cos(theta)
+    sin_theta = np.sin(theta)
+    rings = vertices[1:-1].reshape(ring_count, slices, 3)
+    north = rings[:north_count]
+    np.multiply.outer(ring_radius, cos_theta, out=north[..., 0])
+    np.multiply.outer(ring_radius, sin_theta, out=north[..., 1])
+    north[..., 2] = (radius * np.cos(phi))[:, None]
+    _mirror_z(rings[north_count:], rings[: ring_count - north_count][::-1])
+
+    top = 0  # 0-based; write_obj converts to OBJ's 1-based indices
+    bottom = len(vertices) - 1
+
+    def ring_index(ring: int, j: np.ndarray) -> np.ndarray:
         """ring in [0, stacks-2] (there are stacks-1 rings), j in [0, slices-1]."""
-        return 2 + ring * slices + (j % slices)
+        return 1 + ring * slices + (j % slices)
 
-    ring_count = stacks - 1
+    j = np.arange(slices, dtype=np.int32)
 
     # Top cap: top + first ring
     if ring_count >= 1:
-        for j in range(slices):
-            a = top
-            b = ring_index(0, j)
-            c = ring_index(0, j + 1)
-            faces.append((a, b, c))
+        cap = faces[:slices]
+        cap[:, 0] = top
+        cap[:, 1] = ring_index(0, j)
+        cap[:, 2] = ring_index(0, j + 1)
 
     # Middle quads between rings
-    for ring in range(ring_count - 1):
-        for j in range(slices):
-            a = ring_index(ring, j)
-            b = ring_index(ring + 1, j)
-            c = ring_index(ring + 1, j + 1)
-            d = ring_index(ring, j + 1)
-            faces.append((a, b, d))
-            faces.append((b, c, d))
+    if ring_count >= 2:
+        _quad_faces(ring_count - 1, slices, slices, 1, wrap=True, out=faces[slices:-slices])
 
     # Bottom cap: last ring + bottom
     if ring_count >= 1:
         last_ring = ring_count - 1
-        for j in range(slices):
-            a = ring_index(last_ring, j)
-            b = bottom
-            c = ring_index(last_ring, j + 1)
-            faces.append((a, b, c))
+        cap = faces[-slices:]
+        cap[:, 0] = ring_index(last_ring, j)
+        cap[:, 1] = bottom
+        cap[:, 2] = ring_index(last_ring, j + 1)
 
     return ObjMesh(vertices, faces)
 
 
 def torus(radius_major: float, radius_minor: float, segments_major: int, segments_minor: int) -> ObjMesh:
-    vertices: List[Vector3] = []
-    faces: List[Face] = []
-
-    for i in range(segments_major + 1):
-        u = i / segments_major
-        theta = u * 2.0 * math.pi
-        cos_t = math.cos(theta)
-        sin_t = math.sin(theta)
-        for j in range(segments_minor + 1):
-            v = j / segments_minor
-            phi = v * 2.0 * math.pi
-            cos_p = math.cos(phi)
-            sin_p = math.sin(phi)
-            x = (radius_major + radius_minor * cos_p) * cos_t
-            y = (radius_major + radius_minor * cos_p) * sin_t
-            z = radius_minor * sin_p
-            vertices.append((x, y, z))
-
-    def idx(i: int, j: int) -> int:
-        return i * (segments_minor + 1) + j + 1
-
-    for i in range(segments_major):
-        for j in range(segments_minor):
-            a = idx(i, j)
-            b = idx(i + 1, j)
-            c = idx(i + 1, j + 1)
-            d = idx(i, j + 1)
-            faces.append((a, b, d))
-            faces.append((b, c, d))
+    # Rows follow the major angle, columns the minor angle, so the flattened
+    # order is the row-major layout _quad_faces expects.
+    # The surface is one minor-circle profile (radial distance, z) revolved
+    # about the z axis: the profile is evaluated once and each row is that
+    # profile rotated by theta_i. Columns phi and 2*pi - phi are mirror
+    # images in z, so only phi in [0, pi] is evaluated and the rest are
+    # reflected copies.
+    half = segments_minor // 2 + 1
+    phi = np.linspace(0.0, 2.0 * np.pi, segments_minor + 1)[:half]
+    profile_r = radius_major + radius_minor * np.cos(phi)
+    profile_z = radius_minor * np.sin(phi)
+
+    # theta = 2*pi closes the seam, so the last row repeats the first.
+    theta = np.linspace(0.0, 2.0 * np.pi, segments_major + 1)[:-1]
+    vertices, grid = _grid_vertices(segments_major + 1, segments_minor + 1)
+    upper = grid[:-1, :half]
+    np.multiply.outer(np.cos(theta), profile_r, out=upper[..., 0])
+    np.multiply.outer(np.sin(theta), profile_r, out=upper[..., 1])
+    upper[..., 2] = profile_z
+    _mirror_z(grid[:-1, half:], grid[:-1, segments_minor - half :: -1])
+    grid[-1] = grid[0]
+
+    faces = _quad_faces(segments_major, segments_minor, segments_minor + 1, 0)
 
     return ObjMesh(vertices, faces)
 
 
 def saddle_grid(size: float, divisions: int, height: float = 1.0) -> ObjMesh:
-    vertices: List[Vector3] = []
-    faces: List[Face] = []
-
-    step = (size * 2.0) / divisions
-    for i in range(divisions + 1):
-        y = -size + i * step
-        for j in range(divisions + 1):
-            x = -size + j * step
-            z = height * (x * x - y * y)
-            vertices.append((x, y, z))
-
-    def idx(i: int, j: int) -> int:
-        return i * (divisions + 1) + j + 1
-
-    for i in range(divisions):
-        for j in range(divisions):
-            a = idx(i, j)
-            b = idx(i + 1, j)
-            c = idx(i + 1, j + 1)
-            d = idx(i, j + 1)
-            faces.append((a, b, d))
-            faces.append((b, c, d))
+    # Row i is y, column j is x (row-major, as _quad_faces expects).
+    coords = np.linspace(-size, size, divisions + 1)
+    vertices, grid = _grid_vertices(divisions + 1, divisions + 1)
+    x, y = np.meshgrid(coords, coords, indexing="xy")
+    grid[..., 0] = x
+    grid[..., 1] = y
+    grid[..., 2] = height * (x * x - y * y)
+
+    faces = _quad_faces(divisions, divisions, divisions + 1, 0)
 
     return ObjMesh(vertices, faces)
 
 
 def plane_grid(size: float, divisions: int) -> ObjMesh:
     """Generate a triangulated square grid in the XY plane (Z=0)."""
-    vertices: List[Vector3] = []
-    faces: List[Face] = []
-
     if divisions < 1:
         raise ValueError("divisions must be >= 1")
 
-    step = (size * 2.0) / divisions
-    for i in range(divisions + 1):
-        y = -size + i * step
-        for j in range(divisions + 1):
-            x = -size + j * step
-            vertices.append((x, y, 0.0))
-
-    def idx(i: int, j: int) -> int:
-        return i * (divisions + 1) + j + 1
-
-    for i in range(divisions):
-        for j in range(divisions):
-            a = idx(i, j)
-            b = idx(i + 1, j)
-            c = idx(i + 1, j + 1)
-            d = idx(i, j + 1)
-            faces.append((a, b, d))
-            faces.append((b, c, d))
+    coords = np.linspace(-size, size, divisions + 1)
+    vertices, grid = _grid_vertices(divisions + 1, divisions + 1)
+    grid[..., 0], grid[..., 1] = np.meshgrid(coords, coords, indexing="xy")
+    grid[..., 2] = 0.0
+
+    faces = _quad_faces(divisions, divisions, divisions + 1, 0)
 
     return ObjMesh(vertices, faces)
 
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from .obj_writer import compact_mesh, write_obj
+
+
+class CompactMeshTest(unittest.TestCase):
+    def test_drops_unreferenced_vertices_and_remaps(self) -> None:
+        vertices = [(0.0, 0.0, 0.0), (1.0, 1.0, 1.0), (2.0, 2.0, 2.0), (3.0, 3.0, 3.0)]
+        mesh = compact_mesh(vertices, [(0, 2, 3), (3, 2, 0)])
+
+        np.testing.assert_array_equal(mesh.vertices, [vertices[0], vertices[2], vertices[3]])
+        np.testing.assert_array_equal(mesh.faces, [(0, 1, 2), (2, 1, 0)])
+
+    def test_out_of_range_index_raises(self) -> None:
+        vertices = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)]
+        with self.assertRaises(ValueError):
+            compact_mesh(vertices, [(1, 2, 3)])  # 1-based input
+        with self.assertRaises(ValueError):
+            compact_mesh(vertices, [(-1, 0, 1)])
+
+
+class WriteObjTest(unittest.TestCase):
+    def test_writes_one_based_faces(self) -> None:
+        vertices = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tri.obj")
+            write_obj(path, vertices, [(0, 1, 2)], header=["triangle"])
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+
+        self.assertEqual(
+            text,
+            "# triangle\n"
+            "v 0.000000 0.000000 0.000000\n"
+            "v 1.000000 0.000000 0.000000\n"
+            "v 0.000000 1.000000 0.000000\n"
+            "f 1 2 3\n",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()